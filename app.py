@@ -1,9 +1,13 @@
+import asyncio
 import os
 import streamlit as st
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import pandas as pd
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
 from dataclasses import dataclass
 import plotly.express as px
 import plotly.graph_objects as go
@@ -71,10 +75,14 @@ class SessionStateManager:
     
     @staticmethod
     def get_user_config() -> Optional[UserConfig]:
-        """Get current user configuration"""
+        """Get current user configuration (memoized for the session)"""
         if st.session_state.auth_done and st.session_state.user_data:
             data = st.session_state.user_data
-            return UserConfig(
+            cached = st.session_state.get("_user_config")
+            if cached is not None and cached.id == data["id"]:
+                return cached
+
+            config = UserConfig(
                 id=data["id"],
                 name=data["name"],
                 email=data["email"],
@@ -84,6 +92,8 @@ class SessionStateManager:
                 created_at=data["created_at"],
                 updated_at=data["updated_at"]
             )
+            st.session_state["_user_config"] = config
+            return config
         return None
     
     @staticmethod
@@ -98,9 +108,31 @@ class SessionStateManager:
 # API Service Layer
 # ─────────────────────────────────────────────────────────────────────────────
 
+class APIError(Exception):
+    """Raised when a backend API call fails"""
+    pass
+
+@st.cache_resource(show_spinner=False)
+def _http_session() -> requests.Session:
+    """Shared HTTP session so keep-alive connections survive Streamlit reruns"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "Accept": "application/json",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive"
+    })
+    return session
+
 class APIService:
     @staticmethod
-    def login_user(name: str, email: str, age: int, gender: str, user_type: str) -> Tuple[bool, Dict]:
+    def login_user(name: str, email: str, age: int, gender: str, user_type: str) -> Dict:
         """Login user with the new API structure"""
         try:
             payload = {
@@ -110,40 +142,49 @@ class APIService:
                 "gender": gender,
                 "user_type": user_type
             }
-            
-            resp = requests.post(
+
+            resp = _http_session().post(
                 f"{Config.API_URL}/users/login",
-                json=payload,
-                timeout=10
+                data=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=(3.05, 10)
             )
             resp.raise_for_status()
-            return True, resp.json()
+            return orjson.loads(resp.content)
         except Exception as e:
-            return False, {"error": str(e)}
-    
+            raise APIError(str(e))
+
     @staticmethod
-    def get_user_by_id(user_id: int) -> Tuple[bool, Dict]:
+    def get_user_by_id(user_id: int) -> Dict:
         """Get user information by ID"""
         try:
-            resp = requests.get(f"{Config.API_URL}/users/{user_id}", timeout=10)
+            resp = _http_session().get(f"{Config.API_URL}/users/{user_id}", timeout=(3.05, 10))
             resp.raise_for_status()
-            return True, resp.json()
+            return orjson.loads(resp.content)
         except Exception as e:
-            return False, {"error": str(e)}
+            raise APIError(str(e))
     
     @staticmethod
-    def fetch_assessments() -> List[Dict]:
-        """Fetch all assessments from API"""
+    def get_users_bulk(user_ids: List[int]) -> Dict[int, Dict]:
+        """Fetch several users concurrently, keyed by user ID"""
+        return _cached_users_bulk(tuple(user_ids))
+
+    @staticmethod
+    def fetch_assessments(limit: int = 500, since: Optional[str] = None) -> List[Dict]:
+        """Fetch recent assessments from API, optionally bounded to a time window"""
         try:
-            resp = requests.get(f"{Config.API_URL}/assessments", timeout=10)
+            resp = _http_session().get(
+                f"{Config.API_URL}/assessments",
+                params={"limit": limit, "since": since},
+                timeout=(3.05, 10)
+            )
             resp.raise_for_status()
-            return resp.json()
+            return orjson.loads(resp.content)
         except Exception as e:
-            st.error(f"Failed to fetch assessments: {str(e)}")
-            return []
-    
+            raise APIError(str(e))
+
     @staticmethod
-    def send_chat_message(message: str, history: List[Dict], patient_id: int) -> Tuple[bool, Dict]:
+    def send_chat_message(message: str, history: List[Dict], patient_id: int) -> Dict:
         """Send chat message to triage API"""
         try:
             payload = {
@@ -151,34 +192,102 @@ class APIService:
                 "history": history,
                 "patient_id": patient_id
             }
-            
-            resp = requests.post(
+
+            resp = _http_session().post(
                 f"{Config.API_URL}/triage/chat",
-                json=payload,
-                timeout=30
+                data=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=(3.05, 30)
             )
             resp.raise_for_status()
-            return True, resp.json()
+            return orjson.loads(resp.content)
         except Exception as e:
-            return False, {"error": str(e)}
+            raise APIError(str(e))
+
+    @staticmethod
+    def stream_chat_message(message: str, history: List[Dict], patient_id: int):
+        """Stream chat response events from the triage API as they are generated"""
+        payload = {
+            "message": message,
+            "history": history,
+            "patient_id": patient_id
+        }
+
+        try:
+            with _http_session().post(
+                f"{Config.API_URL}/triage/chat",
+                data=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+                stream=True,
+                timeout=(3.05, None)
+            ) as resp:
+                resp.raise_for_status()
+
+                # The deployed endpoint answers one JSON body per turn; only
+                # iterate SSE lines when the backend actually streams
+                if "text/event-stream" not in resp.headers.get("Content-Type", ""):
+                    yield orjson.loads(resp.content)
+                    return
+
+                got_event = False
+                for line in resp.iter_lines(decode_unicode=True):
+                    if line and line.startswith("data: "):
+                        got_event = True
+                        yield orjson.loads(line[6:])
+
+                if not got_event:
+                    raise APIError("Chat stream ended without any events")
+        except APIError:
+            raise
+        except Exception as e:
+            raise APIError(str(e))
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_assessments(limit: int = 500, since: Optional[str] = None) -> List[Dict]:
+    """Memoized assessments fetch so dashboard reruns within the TTL skip the API"""
+    return APIService.fetch_assessments(limit=limit, since=since)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_users_bulk(user_ids: tuple) -> Dict[int, Dict]:
+    """Memoized concurrent user fan-out; one round of gathered lookups per ID set"""
+    async def _fetch_all() -> List[Dict]:
+        async with httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            timeout=10
+        ) as client:
+            async def fetch_one(user_id: int) -> Dict:
+                try:
+                    resp = await client.get(f"{Config.API_URL}/users/{user_id}")
+                    resp.raise_for_status()
+                    return orjson.loads(resp.content)
+                except Exception:
+                    return {"name": "Unknown", "email": "Unknown"}
+
+            return await asyncio.gather(*(fetch_one(i) for i in user_ids))
+
+    return dict(zip(user_ids, asyncio.run(_fetch_all())))
 
 # ─────────────────────────────────────────────────────────────────────────────
 # UI Components
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Static header markup, built once at import time
+HEADER_HTML = """
+<div style="text-align: center; padding: 1rem 0; background: linear-gradient(90deg, #1f77b4, #2ca02c);
+            border-radius: 10px; margin-bottom: 2rem;">
+    <h1 style="color: white; margin: 0; font-size: 2.5rem;">🏥 Med-MACs</h1>
+    <p style="color: #f0f0f0; margin: 0.5rem 0 0 0; font-size: 1.1rem;">
+        Smarter ER Triage. Faster Care.
+    </p>
+</div>
+"""
+
 class UIComponents:
     @staticmethod
     def render_header():
         """Render main header with branding"""
-        st.markdown("""
-        <div style="text-align: center; padding: 1rem 0; background: linear-gradient(90deg, #1f77b4, #2ca02c); 
-                    border-radius: 10px; margin-bottom: 2rem;">
-            <h1 style="color: white; margin: 0; font-size: 2.5rem;">🏥 Med-MACs</h1>
-            <p style="color: #f0f0f0; margin: 0.5rem 0 0 0; font-size: 1.1rem;">
-                Smarter ER Triage. Faster Care.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(HEADER_HTML, unsafe_allow_html=True)
     
     @staticmethod
     def render_sidebar_auth() -> bool:
@@ -226,15 +335,17 @@ class UIComponents:
                         st.error("❌ You must consent to share your information to proceed.")
                     else:
                         with st.spinner("🔄 Signing in..."):
-                            success, response = APIService.login_user(
-                                name.strip(), 
-                                email.strip(), 
-                                age, 
-                                gender, 
-                                user_type
-                            )
-                            
-                            if success:
+                            try:
+                                response = APIService.login_user(
+                                    name.strip(),
+                                    email.strip(),
+                                    age,
+                                    gender,
+                                    user_type
+                                )
+                            except APIError as e:
+                                st.error(f"❌ Login failed: {str(e)}")
+                            else:
                                 # Check if the returned user_type matches the selected one
                                 if response.get("user_type") != user_type:
                                     st.error(
@@ -247,8 +358,6 @@ class UIComponents:
                                     st.session_state.auth_done = True
                                     st.success("✅ Successfully signed in!")
                                     st.rerun()
-                            else:
-                                st.error(f"❌ Login failed: {response.get('error', 'Unknown error')}")
             
             # Show current user info
             if st.session_state.auth_done and st.session_state.user_data:
@@ -263,15 +372,16 @@ class UIComponents:
                 """)
                 
                 if st.button("🚪 Sign Out", use_container_width=True):
-                    for key in list(st.session_state.keys()):
-                        del st.session_state[key]
+                    st.session_state.clear()
+                    SessionStateManager.init_state()
                     st.rerun()
         
         return st.session_state.auth_done
     
     @staticmethod
+    @st.fragment
     def render_chat_interface(user_config: UserConfig):
-        """Render patient chat interface"""
+        """Render patient chat interface (as a fragment so chat turns skip a full rerun)"""
         st.markdown("### 💬 Chat Assessment")
         
         # Chat container
@@ -294,7 +404,7 @@ class UIComponents:
         with col2:
             if st.session_state.chat_active and st.button("🔄 Reset Chat", use_container_width=True):
                 SessionStateManager.reset_chat()
-                st.rerun()
+                st.rerun(scope="fragment")
         
         with col3:
             if st.button("❓ Help", use_container_width=True):
@@ -331,202 +441,242 @@ class UIComponents:
         st.session_state.finished = False
         
         with st.spinner("🔄 Starting your assessment..."):
-            success, response = APIService.send_chat_message("", [], user_config.id)
-            
-            if success:
+            try:
+                response = APIService.send_chat_message("", [], user_config.id)
+            except APIError as e:
+                st.error(f"❌ Failed to start assessment: {str(e)}")
+                st.session_state.chat_active = False
+            else:
                 st.session_state.messages.append({
                     "role": "assistant",
                     "content": response["response"]
                 })
-                st.rerun()
-            else:
-                st.error(f"❌ Failed to start assessment: {response.get('error', 'Unknown error')}")
-                st.session_state.chat_active = False
+                st.rerun(scope="fragment")
     
     @staticmethod
     def _handle_user_message(user_input: str, user_config: UserConfig):
         """Handle user message in chat"""
         # Add user message
         st.session_state.messages.append({"role": "user", "content": user_input})
-        
-        with st.spinner("🤔 AI is analyzing your response..."):
-            # Convert messages to API format
-            history = [{"role": msg["role"], "content": msg["content"]} 
-                      for msg in st.session_state.messages]
-            
-            success, response = APIService.send_chat_message(user_input, history, user_config.id)
-            
-            if success:
-                st.session_state.messages.append({
-                    "role": "assistant",
-                    "content": response["response"]
-                })
-                
-                if response.get("finished", False):
-                    st.session_state.chat_active = False
-                    st.session_state.finished = True
-                    st.success("✅ Assessment completed successfully!")
-                    st.balloons()
-                
-                st.rerun()
-            else:
-                st.error(f"❌ Error: {response.get('error', 'Unknown error')}")
+
+        # Session messages are already in the API's {role, content} shape
+        history = st.session_state.messages
+
+        st.chat_message("user").markdown(user_input)
+
+        try:
+            # Stream the assistant response into a single placeholder
+            with st.chat_message("assistant"):
+                placeholder = st.empty()
+                accumulated = ""
+                finished = False
+
+                for event in APIService.stream_chat_message(user_input, history, user_config.id):
+                    accumulated += event.get("token", event.get("response", ""))
+                    finished = event.get("finished", finished)
+                    placeholder.markdown(accumulated)
+
+            st.session_state.messages.append({
+                "role": "assistant",
+                "content": accumulated
+            })
+
+            if finished:
+                st.session_state.chat_active = False
+                st.session_state.finished = True
+                st.success("✅ Assessment completed successfully!")
+                st.balloons()
+
+            st.rerun(scope="fragment")
+        except APIError as e:
+            st.error(f"❌ Error: {str(e)}")
+
+# Figures are rebuilt (and re-serialized to JSON) only when the aggregated
+# series actually change, not on every rerun
+_series_hash = {pd.Series: lambda s: pd.util.hash_pandas_object(s).sum()}
+
+@st.cache_data(show_spinner=False, hash_funcs=_series_hash)
+def _build_esi_fig(esi_counts: pd.Series) -> go.Figure:
+    """Build the ESI distribution bar chart"""
+    colors = ['#d62728', '#ff7f0e', '#ffbb78', '#2ca02c', '#98df8a']
+
+    fig = px.bar(
+        x=esi_counts.index,
+        y=esi_counts.values,
+        color=esi_counts.index.astype(str),
+        color_discrete_sequence=colors,
+        title="Distribution by ESI Level"
+    )
+
+    fig.update_layout(
+        xaxis_title="ESI Level",
+        yaxis_title="Count",
+        showlegend=False,
+        height=300
+    )
+
+    return fig
+
+@st.cache_data(show_spinner=False, hash_funcs=_series_hash)
+def _build_timeline_fig(daily: pd.Series) -> go.Figure:
+    """Build the daily assessment volume line chart"""
+    df_daily = daily.reset_index()
+    df_daily.columns = ['date', 'count']
+
+    fig = px.line(
+        df_daily,
+        x='date',
+        y='count',
+        title="Daily Assessment Volume",
+        markers=True
+    )
+
+    fig.update_layout(
+        xaxis_title="Date",
+        yaxis_title="Number of Assessments",
+        height=300
+    )
+
+    return fig
 
 class StaffDashboard:
     @staticmethod
     def render_dashboard(user_config: UserConfig):
         """Render staff dashboard"""
         st.markdown("### 📊 Staff Dashboard")
-        
+
+        control_col1, control_col2 = st.columns([3, 1])
+
+        with control_col1:
+            window = st.selectbox(
+                "🗓️ Time window",
+                ["24h", "7d", "30d", "all"],
+                index=3,
+                help="Only fetch assessments created within this window"
+            )
+
+        with control_col2:
+            if st.button("🔄 Refresh"):
+                _cached_assessments.clear()
+
+        since = None
+        if window != "all":
+            deltas = {"24h": timedelta(hours=24), "7d": timedelta(days=7), "30d": timedelta(days=30)}
+            # Truncate to the minute so the cache key is stable between reruns
+            since = (datetime.now() - deltas[window]).replace(second=0, microsecond=0).isoformat()
+
         # Fetch data
         with st.spinner("📥 Loading assessment data..."):
-            assessments = APIService.fetch_assessments()
+            try:
+                assessments = _cached_assessments(since=since)
+            except APIError as e:
+                st.error(f"Failed to fetch assessments: {str(e)}")
+                assessments = []
         
         if not assessments:
             st.info("📭 No assessments available yet.")
             return
         
         df = pd.DataFrame(assessments)
-        df["created_at"] = pd.to_datetime(df["created_at"])
-        
+        df["created_at"] = pd.to_datetime(df["created_at"], format="ISO8601", cache=True)
+
+        # Compute shared aggregates once instead of per renderer
+        aggs = {
+            'total': len(df),
+            'avg_esi': df['esi_level'].mean(),
+            'emergency': int((df['esi_level'] <= 2).sum()),
+            'latest': df['created_at'].max(),
+            'esi_counts': df['esi_level'].value_counts().sort_index(),
+            'daily': df.set_index('created_at').resample('D').size().rename('count').tail(90)
+        }
+
         # Dashboard metrics
-        StaffDashboard._render_metrics(df)
-        
+        StaffDashboard._render_metrics(aggs)
+
         # Charts
         col1, col2 = st.columns(2)
         with col1:
-            StaffDashboard._render_esi_distribution(df)
+            StaffDashboard._render_esi_distribution(aggs['esi_counts'])
         with col2:
-            StaffDashboard._render_timeline_chart(df)
-        
+            StaffDashboard._render_timeline_chart(aggs['daily'])
+
         # Data table
         StaffDashboard._render_assessments_table(df)
-    
+
     @staticmethod
-    def _render_metrics(df: pd.DataFrame):
+    def _render_metrics(aggs: Dict):
         """Render key metrics"""
         col1, col2, col3, col4 = st.columns(4)
-        
+
         with col1:
             st.metric(
                 "📋 Total Assessments",
-                len(df),
+                aggs['total'],
                 delta=None
             )
-        
+
         with col2:
-            avg_esi = df['esi_level'].mean()
             st.metric(
                 "⚡ Avg ESI Level",
-                f"{avg_esi:.1f}",
+                f"{aggs['avg_esi']:.1f}",
                 delta=None
             )
-        
+
         with col3:
-            emergency_cases = len(df[df['esi_level'] <= 2])
+            emergency_cases = aggs['emergency']
+            emergency_pct = emergency_cases / aggs['total'] * 100.0 if aggs['total'] else 0.0
             st.metric(
                 "🚨 Emergency Cases",
                 emergency_cases,
-                delta=f"{(emergency_cases/len(df)*100):.1f}% of total"
+                delta=f"{emergency_pct:.1f}% of total"
             )
-        
+
         with col4:
-            latest = df['created_at'].max()
+            latest = aggs['latest']
             hours_ago = (datetime.now() - latest.replace(tzinfo=None)).total_seconds() / 3600
             st.metric(
                 "🕐 Last Assessment",
                 f"{hours_ago:.1f}h ago",
                 delta=None
             )
-    
+
     @staticmethod
-    def _render_esi_distribution(df: pd.DataFrame):
+    def _render_esi_distribution(esi_counts: pd.Series):
         """Render ESI level distribution chart"""
         st.markdown("**🎯 ESI Level Distribution**")
-        
-        esi_counts = df['esi_level'].value_counts().sort_index()
-        
-        colors = ['#d62728', '#ff7f0e', '#ffbb78', '#2ca02c', '#98df8a']
-        
-        fig = px.bar(
-            x=esi_counts.index,
-            y=esi_counts.values,
-            color=esi_counts.index.astype(str),
-            color_discrete_sequence=colors,
-            title="Distribution by ESI Level"
-        )
-        
-        fig.update_layout(
-            xaxis_title="ESI Level",
-            yaxis_title="Count",
-            showlegend=False,
-            height=300
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
-    
+        st.plotly_chart(_build_esi_fig(esi_counts), use_container_width=True, theme=None)
+
     @staticmethod
-    def _render_timeline_chart(df: pd.DataFrame):
+    def _render_timeline_chart(daily: pd.Series):
         """Render assessments timeline"""
         st.markdown("**📈 Assessment Timeline**")
-        
-        # Group by date
-        df_daily = df.groupby(df['created_at'].dt.date).size().reset_index()
-        df_daily.columns = ['date', 'count']
-        
-        fig = px.line(
-            df_daily,
-            x='date',
-            y='count',
-            title="Daily Assessment Volume",
-            markers=True
-        )
-        
-        fig.update_layout(
-            xaxis_title="Date",
-            yaxis_title="Number of Assessments",
-            height=300
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_build_timeline_fig(daily), use_container_width=True, theme=None)
     
     @staticmethod
     def _render_assessments_table(df: pd.DataFrame):
         """Render assessments data table"""
         st.markdown("**📋 Recent Assessments**")
         
-        # Prepare display dataframe
-        display_df = df.copy()
-        display_df['created_at'] = pd.to_datetime(display_df['created_at']).dt.strftime("%Y-%m-%d %H:%M:%S")
-        
+        # Prepare display dataframe (only the columns the table needs)
+        display_df = df[['id', 'user_id', 'esi_level', 'diagnosis', 'notes', 'created_at']].copy()
+        # Sort by creation time (newest first) while created_at is still
+        # datetime64 — int64 comparisons instead of string comparisons
+        display_df = display_df.sort_values('created_at', ascending=False, kind='mergesort')
+        display_df['created_at'] = display_df['created_at'].dt.strftime("%Y-%m-%d %H:%M:%S")
+
         # Add user information by fetching user details
         if not display_df.empty:
-            # Create a dictionary to store user info to avoid multiple API calls
-            user_info_cache = {}
-            user_names = []
-            user_emails = []
-            
-            for user_id in display_df['user_id']:
-                if user_id not in user_info_cache:
-                    success, user_data = APIService.get_user_by_id(user_id)
-                    if success:
-                        user_info_cache[user_id] = user_data
-                    else:
-                        user_info_cache[user_id] = {"name": "Unknown", "email": "Unknown"}
-                
-                user_info = user_info_cache[user_id]
-                user_names.append(user_info.get("name", "Unknown"))
-                user_emails.append(user_info.get("email", "Unknown"))
-            
-            display_df['patient_name'] = user_names
-            display_df['patient_email'] = user_emails
+            # Fetch each unique user once, in parallel, instead of per row
+            unique_ids = display_df['user_id'].unique().tolist()
+            user_info_cache = APIService.get_users_bulk(unique_ids)
+            name_map = {k: v.get('name', 'Unknown') for k, v in user_info_cache.items()}
+            email_map = {k: v.get('email', 'Unknown') for k, v in user_info_cache.items()}
+            display_df['patient_name'] = display_df['user_id'].map(name_map).fillna('Unknown')
+            display_df['patient_email'] = display_df['user_id'].map(email_map).fillna('Unknown')
         
         # Select columns to display
         columns = ["id", "patient_name", "patient_email", "esi_level", "diagnosis", "notes", "created_at"]
-        
-        # Sort by creation time (newest first)
-        display_df = display_df.sort_values('created_at', ascending=False)
-        
+
         st.dataframe(
             display_df[columns],
             use_container_width=True,
@@ -552,6 +702,38 @@ class StaffDashboard:
 # Main Application
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Static page chrome, built once at import time rather than per rerun
+CSS_BLOB = """
+<style>
+.main > div {
+    padding-top: 2rem;
+}
+.stChatMessage {
+    padding: 1rem;
+    border-radius: 10px;
+    margin-bottom: 1rem;
+}
+.stButton > button {
+    border-radius: 20px;
+    border: none;
+    font-weight: 600;
+}
+.metric-container {
+    background: #f8f9fa;
+    padding: 1rem;
+    border-radius: 10px;
+    margin-bottom: 1rem;
+}
+</style>
+"""
+
+WELCOME_HTML = """
+<div style="text-align: center; padding: 3rem; color: #666;">
+    <h3>👋 Welcome!</h3>
+    <p>Please sign in using the sidebar to get started with your health assessment.</p>
+</div>
+"""
+
 def main():
     """Main application entry point"""
     # Page configuration
@@ -566,41 +748,14 @@ def main():
     SessionStateManager.init_state()
     
     # Custom CSS
-    st.markdown("""
-    <style>
-    .main > div {
-        padding-top: 2rem;
-    }
-    .stChatMessage {
-        padding: 1rem;
-        border-radius: 10px;
-        margin-bottom: 1rem;
-    }
-    .stButton > button {
-        border-radius: 20px;
-        border: none;
-        font-weight: 600;
-    }
-    .metric-container {
-        background: #f8f9fa;
-        padding: 1rem;
-        border-radius: 10px;
-        margin-bottom: 1rem;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(CSS_BLOB, unsafe_allow_html=True)
     
     # Render header
     UIComponents.render_header()
     
     # Handle authentication
     if not UIComponents.render_sidebar_auth():
-        st.markdown("""
-        <div style="text-align: center; padding: 3rem; color: #666;">
-            <h3>👋 Welcome!</h3>
-            <p>Please sign in using the sidebar to get started with your health assessment.</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(WELCOME_HTML, unsafe_allow_html=True)
         st.stop()
     
     # Get user configuration